@@ -665,7 +665,6 @@ def jsonl2mst(jsonl_input, mst_output, mst_encoding, mode, ftf, **kwargs):
 def iso2jsonl(iso_input, jsonl_output, iso_encoding, mode, utf8_fix, **kwargs):
     """ISO2709 to JSON Lines."""
     ensure_ascii = jsonl_output.encoding.lower() == "ascii"
-    kwargs["record_struct"] = kw_call(iso.create_record_struct, **kwargs)
     sfp = kw_call(SubfieldParser, **kwargs)
     decode = utf8_fix_nest_decode if utf8_fix else nest_decode
     for tl in kw_call(iso.iter_raw_tl, iso_input, **kwargs):
@@ -684,7 +683,8 @@ def iso2jsonl(iso_input, jsonl_output, iso_encoding, mode, utf8_fix, **kwargs):
 @file_arg_enc_option("iso", "wb", iso.DEFAULT_ISO_ENCODING)
 def jsonl2iso(jsonl_input, iso_output, iso_encoding, mode, ftf, **kwargs):
     """JSON Lines to ISO2709."""
-    record_struct = kw_call(iso.create_record_struct, **kwargs)
+    record_struct = kw_call(iso.create_record_struct, **kwargs,
+                            entry_map=iso.DEFAULT_ENTRY_MAP)
     sfp = kw_call(SubfieldParser, **kwargs, check=kwargs["sfcheck"])
     tl_gen = read_json_raw_tl(
         stream=jsonl_input,
@@ -784,7 +784,6 @@ def csv2mst(csv_input, mst_output, mst_encoding, cmode, ftf, **kwargs):
 def iso2csv(iso_input, csv_output, iso_encoding, cmode, utf8_fix, **kwargs):
     """ISO2709 to CSV."""
     kwargs["prepend_mfn"] = True
-    kwargs["record_struct"] = kw_call(iso.create_record_struct, **kwargs)
     sfp = kw_call(SubfieldParser, **kwargs)
     decode = utf8_fix_nest_decode if utf8_fix else nest_decode
     csv_writer = csv.writer(csv_output)
@@ -805,7 +804,8 @@ def iso2csv(iso_input, csv_output, iso_encoding, cmode, utf8_fix, **kwargs):
 @file_arg_enc_option("iso", "wb", iso.DEFAULT_ISO_ENCODING)
 def csv2iso(csv_input, iso_output, iso_encoding, cmode, ftf, **kwargs):
     """CSV to ISO2709."""
-    record_struct = kw_call(iso.create_record_struct, **kwargs)
+    record_struct = kw_call(iso.create_record_struct, **kwargs,
+                            entry_map=iso.DEFAULT_ENTRY_MAP)
     sfp = kw_call(SubfieldParser, **kwargs, check=kwargs["sfcheck"])
     tl_gen = read_csv_raw_tl(
         stream=csv_input,
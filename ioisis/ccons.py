@@ -3,6 +3,7 @@ from contextlib import closing
 
 from construct import Adapter, Array, Bytes, Check, RepeatUntil, \
                       Struct, Subconstruct
+from construct.core import evaluate, stream_read, stream_write
 
 from .streamutils import LineSplittedBytesStreamWrapper
 
@@ -65,13 +66,12 @@ class IndexedRange(Adapter):
 class IntASCII(Bytes):
     """ASCII numbers with the given number of bytes."""
     def _parse(self, stream, context, path):
-        obj = super()._parse(stream, context, path)
-        return int(obj, base=10)
+        length = evaluate(self.length, context)
+        return int(stream_read(stream, length, path), base=10)
 
     def _build(self, obj, stream, context, path):
-        length = self._sizeof(context, path)
-        obj_as_bytes = (b"%d" % obj).zfill(length)
-        super()._build(obj_as_bytes, stream, context, path)
+        length = evaluate(self.length, context)
+        stream_write(stream, (b"%d" % obj).zfill(length), length, path)
         return obj
 
 
@@ -80,18 +80,24 @@ class LineSplitRestreamed(Subconstruct):
     that parses a "line splitted" data,
     builds the lines appending the ``newline`` character/string,
     and works properly with a last incomplete chunk.
+    When parsing, the position of every newline is checked
+    only if ``validate`` is ``True``,
+    otherwise that happens just when the number of newlines
+    found in the data isn't the expected one.
     """
     def __init__(self, subcon, line_len=DEFAULT_LINE_LEN,
-                 newline=DEFAULT_NEWLINE):
+                 newline=DEFAULT_NEWLINE, validate=False):
         super().__init__(subcon)
         self.line_len = line_len
         self.newline = newline
+        self.validate = validate
 
     def _parse(self, stream, context, path):
         with closing(LineSplittedBytesStreamWrapper(
             substream=stream,
             line_len=self.line_len,
             newline=self.newline,
+            validate=self.validate,
         )) as stream2:
             return self.subcon._parsereport(stream2, context, path)
 
@@ -4,6 +4,7 @@ import re
 
 
 DEFAULT_FTF_TEMPLATE = b"%z"
+FTF_CACHE_SIZE = 4096
 
 # The UTF-8 bytes (and number of bits to store a code point) are:
 #
@@ -80,6 +81,10 @@ class FieldTagFormatter:
     int_tags : bool
         If True, the raw tags are always integers (MST).
         If False, the raw tags are strings with 3 characters (ISO).
+
+    When the template doesn't have the index,
+    the formatted tag strings are cached
+    (up to ``FTF_CACHE_SIZE`` distinct tags).
     """
     def __init__(self, template, int_tags):
         self.template = template
@@ -103,6 +108,7 @@ class FieldTagFormatter:
         # a format string to use with the "%" operator
         # and a regex to parse a rendered tag string like a "scanf"
         self.need_rtag = self.need_ztag = self.need_itag = False
+        self.need_index = False
         parts = []
         sparts = []
         self.sparams = []
@@ -134,12 +140,14 @@ class FieldTagFormatter:
                 self.sparams.append(("tag", df["0"] if gzero else df[" "]))
             elif gcode == df["i"]:  # %i (index)
                 parts.extend([df["%(index)"], gsize, df["d"]])
+                self.need_index = True
                 sparts.append(df[_int_scanf_regex_str(gsize_int, gzero)])
                 self.sparams.append(("index", df["0"] if gzero else df[" "]))
             else:
                 raise ValueError(f"Unknown format {gtext!r}")
         self._fmt = df[""].join(parts)
         self._scanf_regex = re.compile(df[""].join(sparts))
+        self._cache = {}
 
     def __call__(self, tag, index=-1):
         """Convert the given tag, itag and index (keyword arguments)
@@ -147,6 +155,16 @@ class FieldTagFormatter:
         The required arguments are the ones that appears
         in the format string of this instance.
         """
+        if self.need_index:
+            return self._format(tag, index)
+        result = self._cache.get(tag)
+        if result is None:
+            result = self._format(tag, index)
+            if len(self._cache) < FTF_CACHE_SIZE:
+                self._cache[tag] = result
+        return result
+
+    def _format(self, tag, index):
         df = self._df
         is_int = self.int_tags
         kwargs = {df.index: index}
@@ -192,7 +210,9 @@ class FieldTagFormatter:
 
 
 def con_pairs(con, ftf):
-    """Generator of raw ``(tag, field)`` pairs of ``bytes`` objects.
+    """Generator of raw ``(tag, field)`` pairs of ``bytes`` objects
+    (the field might be a ``memoryview`` instead,
+    as it comes from the input).
     The input should be a raw construct container (dictionary)
     representing a single record from a parsed ISO or MST file.
     """
@@ -4,18 +4,24 @@ This file format specification can be found at:
 
 https://wiki.bireme.org/pt/img_auth.php/5/5f/2709BR.pdf
 """
-from collections import defaultdict
-from itertools import accumulate
+from contextlib import closing
+from functools import lru_cache
+from itertools import accumulate, chain
+import mmap
+import struct
 
-from construct import Array, Bytes, Check, Computed, \
+from construct import Array, Bytes, Check, CheckError, Computed, \
                       Const, Container, Default, ExprAdapter, \
-                      FocusedSeq, Prefixed, RawCopy, \
-                      Rebuild, Select, Struct, Terminated
+                      FocusedSeq, ListContainer, Prefixed, \
+                      Rebuild, StreamError, Struct
 
 from .ccons import IntASCII, LineSplitRestreamed, \
                    DEFAULT_LINE_LEN, DEFAULT_NEWLINE
 from .fieldutils import con_pairs, DEFAULT_FTF_TEMPLATE, FieldTagFormatter
-from .streamutils import should_be_file, TightBufferReadOnlyBytesStreamWrapper
+from .streamutils import join_lines, should_be_file, LineSplitError, \
+                         MemoryViewReadOnlyBytesStreamWrapper, \
+                         SlabBufferReadOnlyBytesStreamWrapper, \
+                         TightBufferReadOnlyBytesStreamWrapper
 
 
 DEFAULT_FIELD_TERMINATOR = b"#"
@@ -29,6 +35,37 @@ TAG_LEN = 3
 DEFAULT_LEN_LEN = 4
 DEFAULT_POS_LEN = 5
 DEFAULT_CUSTOM_LEN = 0
+DEFAULT_ENTRY_MAP = (DEFAULT_LEN_LEN, DEFAULT_POS_LEN, DEFAULT_CUSTOM_LEN)
+ENTRY_MAP_KEYS = ("len_len", "pos_len", "custom_len")
+DEFAULT_SLAB_SIZE = 2 ** 20
+
+# Separator for decoding several fields at once (the "unit separator")
+DECODE_SEPARATOR = "\x1f"
+DECODE_SEPARATOR_BYTES = DECODE_SEPARATOR.encode("ascii")
+
+# Leader/header layout, including the leading total_len
+LEADER_STRUCT = struct.Struct("5s1s1s2s1s1s1s5s3s1s1s1s1s")
+LEADER_KEYS = [
+    "total_len", "status", "type", "custom_2", "coding",
+    "indicator_count", "identifier_len", "base_addr", "custom_3",
+    "len_len", "pos_len", "custom_len", "reserved",
+]
+LEADER_INT_KEYS = [
+    "total_len", "indicator_count", "identifier_len", "base_addr",
+    "len_len", "pos_len", "custom_len",
+]
+
+
+def _check_dir_contiguous(dir_entries):
+    """Check if the position of each directory entry
+    is the sum of the lengths of the previous entries.
+    """
+    expected_pos = 0
+    for entry in dir_entries:
+        if entry.pos != expected_pos:
+            return False
+        expected_pos += entry.len
+    return True
 
 
 def create_record_struct(
@@ -36,27 +73,52 @@ def create_record_struct(
     record_terminator=DEFAULT_RECORD_TERMINATOR,
     line_len=DEFAULT_LINE_LEN,
     newline=DEFAULT_NEWLINE,
+    strict=True,
+    entry_map=None,
 ):
-    """Create a construct parser/builder for a whole record object."""
+    """Create a construct parser/builder for a whole record object.
+    If ``strict`` is ``False``, the directory entry positions
+    aren't checked when parsing.
+    The ``entry_map`` is either ``None`` or
+    a ``(len_len, pos_len, custom_len)`` tuple of integers,
+    and the latter creates a struct specialized for that layout,
+    which can only parse records having that directory entry map.
+    """
     ft_len = len(field_terminator)
+    if entry_map is None:
+        entry_map_fields = [
+            key / Default(IntASCII(1), default)
+            for key, default in zip(ENTRY_MAP_KEYS, DEFAULT_ENTRY_MAP)
+        ]
+        get_entry_map = lambda this: \
+            tuple(map(this.get, ENTRY_MAP_KEYS, DEFAULT_ENTRY_MAP))
+        get_entry_len = lambda this: TAG_LEN + sum(get_entry_map(this))
+    else:
+        entry_map_fields = [key / Const(value, IntASCII(1))
+                            for key, value in zip(ENTRY_MAP_KEYS, entry_map)]
+        entry_len = TAG_LEN + sum(entry_map)
+        get_entry_map = lambda this: entry_map
+        get_entry_len = lambda this: entry_len
+
     prefixless = Struct(
-        # Build time pre-computed information
+        # The Prefixed total_len includes itself and this whole struct
+        "total_len" / Computed(
+            lambda this: TOTAL_LEN_LEN + len(this._io.getvalue())
+        ),
+
+        # Build time pre-computed information,
+        # evaluated once per record
         "_build_len_list" / Computed(
             lambda this: None if "fields" not in this else
                 [len(field) + ft_len for field in this.fields]
         ),
         "_build_pos_list" / Computed(
             lambda this: None if "fields" not in this else
-                list(accumulate([0] + this._build_len_list))
+                list(accumulate(chain([0], this._build_len_list)))
         ),
         "_build_dir_len" / Computed(
             lambda this: None if "fields" not in this else
-                len(this.fields) * (
-                    TAG_LEN
-                    + this.get("len_len", DEFAULT_LEN_LEN)
-                    + this.get("pos_len", DEFAULT_POS_LEN)
-                    + this.get("custom_len", DEFAULT_CUSTOM_LEN)
-                )
+                len(this.fields) * get_entry_len(this)
         ),
 
         # Record leader/header (apart from the leading total_len)
@@ -71,38 +133,49 @@ def create_record_struct(
         "custom_3" / Default(Bytes(3), b"000"),
 
         # Directory entry map (trailing part of the leader)
-        "len_len" / Default(IntASCII(1), DEFAULT_LEN_LEN),
-        "pos_len" / Default(IntASCII(1), DEFAULT_POS_LEN),
-        "custom_len" / Default(IntASCII(1), DEFAULT_CUSTOM_LEN),
+        *entry_map_fields,
         "reserved" / Default(Bytes(1), b"0"),
 
         # The ISO leader/header doesn't have the number of fields,
         # but it can be found from the base address
+        "_entry_len" / Computed(get_entry_len),
         "num_fields" / Computed(lambda this:
-            (this.base_addr - LEADER_LEN - ft_len) //
-            (TAG_LEN + this.len_len + this.pos_len + this.custom_len)
+            (this.base_addr - LEADER_LEN - ft_len) // this._entry_len
         ),
         Check(lambda this:
             "fields" not in this or this.num_fields == len(this.fields)
         ),
 
         # Directory
-        "dir" / Struct(
-            "tag" / Bytes(TAG_LEN),
-            "len" / Rebuild(IntASCII(lambda this: this._.len_len),
-                            lambda this: this._._build_len_list[this._index]),
-            "pos" / Rebuild(IntASCII(lambda this: this._.pos_len),
-                            lambda this: this._._build_pos_list[this._index]),
-            "custom" / Default(Bytes(lambda this: this._.custom_len),
-                               lambda this: b"0" * this._.custom_len),
-        )[lambda this: this.num_fields],
-        Check(lambda this: this.num_fields == 0 or (
-            this.dir[0].pos == 0 and
-            all(
-                this.dir[idx + 1].pos == entry.pos + entry.len
-                for idx, entry in enumerate(this.dir[:-1])
+        "dir" / ExprAdapter(
+            Bytes(lambda this: this.num_fields * this._entry_len),
+            lambda obj, ctx: ListContainer(
+                Container(tag=tag, len=length, pos=pos, custom=custom)
+                for tag, length, pos, custom in zip(
+                    *_parse_directory(obj, *get_entry_map(ctx))
+                )
+            ),
+            lambda obj, ctx: _build_directory(
+                tags=[entry["tag"] for entry in obj],
+                lens=ctx._build_len_list,
+                poss=ctx._build_pos_list,
+                customs=[entry.get("custom", b"0" * get_entry_map(ctx)[2])
+                         for entry in obj],
+                len_len=get_entry_map(ctx)[0],
+                pos_len=get_entry_map(ctx)[1],
+                custom_len=get_entry_map(ctx)[2],
+            ),
+        ),
+        *([Check(lambda this: this._build_len_list is not None  # Building
+                              or _check_dir_contiguous(this.dir))]
+          if strict else []),
+        "_value_lens" / Computed(lambda this: [
+            length - ft_len for length in (
+                [entry.len for entry in this.dir]
+                if this._build_len_list is None else
+                this._build_len_list
             )
-        )),
+        ]),
         Const(field_terminator),
         Check(lambda this: this._io.tell() + TOTAL_LEN_LEN == this.base_addr),
 
@@ -111,9 +184,7 @@ def create_record_struct(
             lambda this: this.num_fields,
             FocusedSeq(
                 "value",
-                "value" / Bytes(
-                    lambda this: this._.dir[this._index].len - ft_len
-                ),
+                "value" / Bytes(lambda this: this._._value_lens[this._index]),
                 Const(field_terminator),
             ),
         ),
@@ -123,14 +194,10 @@ def create_record_struct(
     )
 
     # This includes (and checks) the total_len prefix
-    result = ExprAdapter(
-        RawCopy(Prefixed(
-            lengthfield=IntASCII(TOTAL_LEN_LEN),
-            subcon=prefixless,
-            includelength=True,
-        )),
-        lambda obj, ctx: Container(total_len=obj.length, **obj.value),
-        lambda obj, ctx: {"value": obj},
+    result = Prefixed(
+        lengthfield=IntASCII(TOTAL_LEN_LEN),
+        subcon=prefixless,
+        includelength=True,
     )
 
     if line_len is None or line_len == 0:
@@ -139,18 +206,260 @@ def create_record_struct(
 
 
 DEFAULT_RECORD_STRUCT = create_record_struct()
+DEFAULT_BUILD_RECORD_STRUCT = create_record_struct(entry_map=DEFAULT_ENTRY_MAP)
+
+
+@lru_cache(maxsize=None)
+def _create_dir_entry_struct(len_len, pos_len, custom_len):
+    """Create a struct to split a directory entry in its 4 parts."""
+    return struct.Struct(f"{TAG_LEN}s{len_len}s{pos_len}s{custom_len}s")
+
+
+def _parse_directory(dir_data, len_len, pos_len, custom_len):
+    """Split the whole raw directory at once into 4 columns
+    (tags, lengths, positions and custom data),
+    converting the lengths and the positions to int in bulk.
+    """
+    dir_entry_struct = _create_dir_entry_struct(len_len, pos_len, custom_len)
+    tags, raw_lens, raw_poss, customs = tuple(zip(
+        *dir_entry_struct.iter_unpack(dir_data)
+    )) or ((),) * 4
+    return tags, list(map(int, raw_lens)), list(map(int, raw_poss)), customs
+
+
+def _check_dir_widths(tags, lens, poss, customs,
+                      len_len, pos_len, custom_len):
+    """Check if every directory entry value fits in its width,
+    raising StreamError otherwise."""
+    for name, values, size in [("tag", tags, TAG_LEN),
+                               ("custom", customs, custom_len)]:
+        wrong = next((value for value in values if len(value) != size), None)
+        if wrong is not None:
+            raise StreamError(f"Directory entry {name} {wrong!r} "
+                              f"should have {size} byte(s)")
+    for name, numbers, size in [("len", lens, len_len),
+                                ("pos", poss[:len(lens)], pos_len)]:
+        max_number = max(numbers, default=0)
+        if max_number >= 10 ** size:
+            raise StreamError(f"Directory entry {name} value {max_number} "
+                              f"doesn't fit in {size} byte(s)")
+
+
+def _build_directory(tags, lens, poss, customs,
+                     len_len, pos_len, custom_len):
+    """Build the whole raw directory at once from its 4 columns."""
+    _check_dir_widths(tags, lens, poss, customs,
+                      len_len, pos_len, custom_len)
+    return b"".join(
+        b"%s%0*d%0*d%s" % (tag, len_len, length, pos_len, pos, custom)
+        for tag, length, pos, custom in zip(tags, lens, poss, customs)
+    )
+
+
+def _parse_leader(data):
+    """Parse the leader of a record from its raw data."""
+    if len(data) < LEADER_LEN:
+        raise StreamError("Record smaller than its leader")
+    leader = Container(zip(LEADER_KEYS, LEADER_STRUCT.unpack_from(data)))
+    for key in LEADER_INT_KEYS:
+        leader[key] = int(leader[key], base=10)
+    if leader.total_len != len(data):
+        raise StreamError("Invalid record total_len")
+    return leader
+
+
+def _fast_parse_directory(
+    data,
+    leader,
+    field_terminator=DEFAULT_FIELD_TERMINATOR,
+    record_terminator=DEFAULT_RECORD_TERMINATOR,
+):
+    """Parse and check the directory of a single record
+    from its raw data without line splitting and its parsed leader,
+    returning the number of fields and the 4 directory columns.
+    """
+    ft_len = len(field_terminator)
+    entry_len = TAG_LEN + leader.len_len + leader.pos_len + leader.custom_len
+    base_addr = leader.base_addr
+    num_fields = (base_addr - LEADER_LEN - ft_len) // entry_len
+    dir_end = LEADER_LEN + num_fields * entry_len
+    if dir_end + ft_len != base_addr:
+        raise CheckError("Invalid base_addr")
+    if data[dir_end:base_addr] != field_terminator:
+        raise CheckError("Missing field terminator after the directory")
+
+    tags, lens, poss, customs = _parse_directory(
+        data[LEADER_LEN:dir_end],
+        leader.len_len, leader.pos_len, leader.custom_len,
+    )
+    ends = list(accumulate(lens))
+    if poss != [0, *ends][:-1] or min(lens, default=ft_len) < ft_len:
+        raise CheckError("Invalid directory")
+    if any(data[base_addr + end - ft_len:base_addr + end] != field_terminator
+           for end in ends):
+        raise CheckError("Missing field terminator")
+
+    record_end = base_addr + (ends[-1] if ends else 0)
+    if data[record_end:record_end + len(record_terminator)] \
+            != record_terminator:
+        raise CheckError("Missing record terminator")
+    return num_fields, (tags, lens, poss, customs)
+
+
+def _fast_parse_record(
+    data,
+    field_terminator=DEFAULT_FIELD_TERMINATOR,
+    record_terminator=DEFAULT_RECORD_TERMINATOR,
+):
+    """Parse a single record from its raw data without line splitting,
+    the same way the record struct would do, but without construct.
+    The fields are memoryview slices of the given data.
+    """
+    leader = _parse_leader(data)
+    num_fields, (tags, lens, poss, customs) = _fast_parse_directory(
+        data, leader,
+        field_terminator=field_terminator,
+        record_terminator=record_terminator,
+    )
+    data_view = memoryview(data)
+    start = leader.base_addr
+    stop_offset = start - len(field_terminator)
+    return Container(
+        leader,
+        num_fields=num_fields,
+        dir=ListContainer(
+            Container(tag=tag, len=length, pos=pos, custom=custom)
+            for tag, length, pos, custom in zip(tags, lens, poss, customs)
+        ),
+        fields=ListContainer(
+            data_view[start + pos:stop_offset + pos + length]
+            for pos, length in zip(poss, lens)
+        ),
+    )
+
 
+def _fast_iter_raw_pairs(
+    data,
+    leader,
+    ftf,
+    field_terminator=DEFAULT_FIELD_TERMINATOR,
+    record_terminator=DEFAULT_RECORD_TERMINATOR,
+):
+    """Generator of the raw ``(tag, field)`` pairs of ``bytes`` objects
+    of a single record, like ``con_pairs`` would give
+    for the ``_fast_parse_record`` result,
+    but slicing the fields straight from the record data.
+    """
+    _, (tags, lens, poss, _) = _fast_parse_directory(
+        data, leader,
+        field_terminator=field_terminator,
+        record_terminator=record_terminator,
+    )
+    data = bytes(data)
+    start = leader.base_addr
+    stop_offset = start - len(field_terminator)
+    for idx, (tag, length, pos) in enumerate(zip(tags, lens, poss)):
+        yield ftf(tag, idx), data[start + pos:stop_offset + pos + length]
+
+
+def _split_len(size, line_len, newline):
+    """Size of the given amount of data after line splitting it."""
+    if not line_len:
+        return size
+    return size + -(-size // line_len) * len(newline)
+
+
+def _create_reader(iso_file, slab_size):
+    """Wrap the file to read memoryview windows from it,
+    directly if it's a ``mmap.mmap``, else from slabs.
+    """
+    if isinstance(iso_file, mmap.mmap):
+        return MemoryViewReadOnlyBytesStreamWrapper(iso_file,
+                                                    iso_file.tell())
+    return SlabBufferReadOnlyBytesStreamWrapper(iso_file, slab_size)
+
+
+def _parse_total_len(prefix):
+    """Get the total_len from the joined beginning of a record."""
+    total_len_raw = bytes(prefix[:TOTAL_LEN_LEN])
+    if len(total_len_raw) != TOTAL_LEN_LEN or not total_len_raw.isdigit():
+        raise StreamError(f"Invalid record total_len {total_len_raw!r}")
+    return int(total_len_raw, base=10)
 
-@should_be_file("iso_file")
-def iter_con(iso_file, record_struct=DEFAULT_RECORD_STRUCT):
-    """Generator of records as parsed construct objects."""
-    alt_struct = Select(record_struct, Terminated)
-    while True:
-        stream_reader = TightBufferReadOnlyBytesStreamWrapper(iso_file)
-        con = alt_struct.parse_stream(stream_reader)
-        if con is None:  # No more records
-            return
-        yield con
+
+def _iter_record_data(iso_file, line_len, newline, slab_size):
+    """Generator of the raw data of each record without line splitting,
+    reading the file in slabs, unless it's a ``mmap.mmap``.
+    Records without line splitting are memoryview windows
+    of a slab or of the memory map.
+    When the generator finishes or is closed, the file position
+    is restored to the end of the last record read from it,
+    unless the file isn't seekable (e.g. a pipe).
+    """
+    nl_len = len(newline) if line_len else 0
+    prefix_split_len = _split_len(TOTAL_LEN_LEN, line_len, newline) - nl_len
+    with closing(_create_reader(iso_file, slab_size)) as reader:
+        while True:
+            prefix_raw = reader.peek(prefix_split_len)
+            if not prefix_raw:  # No more records
+                return
+            if line_len:
+                prefix_raw = join_lines(prefix_raw, line_len, newline)
+            total_len = _parse_total_len(prefix_raw)
+            split_len = _split_len(total_len, line_len, newline)
+            raw = reader.read(split_len)
+            if len(raw) != split_len:
+                raise StreamError("Incomplete record")
+            if not line_len:
+                yield raw
+            elif raw[split_len - nl_len:] != newline:
+                raise LineSplitError("Invalid record line splitting")
+            else:
+                yield join_lines(raw[:split_len - nl_len], line_len, newline)
+
+
+@should_be_file("iso_file", use_mmap=True)
+def iter_con(
+    iso_file,
+    record_struct=None,
+    *,
+    field_terminator=DEFAULT_FIELD_TERMINATOR,
+    record_terminator=DEFAULT_RECORD_TERMINATOR,
+    line_len=DEFAULT_LINE_LEN,
+    newline=DEFAULT_NEWLINE,
+    slab_size=DEFAULT_SLAB_SIZE,
+):
+    """Generator of records as parsed construct objects.
+
+    When a ``record_struct`` is given, it's used for parsing
+    and the remaining keyword arguments are ignored.
+    Otherwise, the records are parsed with ``_fast_parse_record``,
+    which is faster, and the keyword arguments
+    have the same meaning they have in ``create_record_struct``.
+    In such case, the fields are memoryview objects
+    instead of bytes, sharing the memory of the whole record data,
+    and the file is read in slabs of ``slab_size`` bytes,
+    unless it's memory mapped (when a file name is given).
+    The file position is moved back to the end of the last record
+    when this generator finishes or is closed,
+    but that's not possible for a non-seekable file (e.g. a pipe),
+    which might have been read up to a whole slab further.
+    """
+    if record_struct is not None:
+        while True:
+            stream_reader = TightBufferReadOnlyBytesStreamWrapper(iso_file)
+            if not stream_reader.read(1):  # No more records
+                return
+            stream_reader.seek(0)
+            yield record_struct.parse_stream(stream_reader)
+
+    for data in _iter_record_data(iso_file, line_len=line_len,
+                                  newline=newline, slab_size=slab_size):
+        yield _fast_parse_record(
+            data,
+            field_terminator=field_terminator,
+            record_terminator=record_terminator,
+        )
 
 
 def iter_records(iso_file, encoding=DEFAULT_ISO_ENCODING, **kwargs):
@@ -159,20 +468,69 @@ def iter_records(iso_file, encoding=DEFAULT_ISO_ENCODING, **kwargs):
         yield con2dict(con, encoding=encoding)
 
 
+def _fast_iter_status_pairs(iso_file, ftf, field_terminator,
+                            record_terminator, line_len, newline, slab_size):
+    """Generator of ``(status, pairs)`` for each record in the file,
+    where ``pairs`` is a lazy ``_fast_iter_raw_pairs`` generator,
+    so that the directory of a skipped record is never parsed.
+    """
+    for data in _iter_record_data(iso_file, line_len=line_len,
+                                  newline=newline, slab_size=slab_size):
+        leader = _parse_leader(data)
+        yield leader.status, _fast_iter_raw_pairs(
+            data, leader, ftf=ftf,
+            field_terminator=field_terminator,
+            record_terminator=record_terminator,
+        )
+
+
+@should_be_file("iso_file", use_mmap=True)
 def iter_raw_tl(iso_file, *,
                 only_active=True, prepend_mfn=False, prepend_status=False,
                 ftf=DEFAULT_ISO_FTF,
-                record_struct=DEFAULT_RECORD_STRUCT):
-    containers = iter_con(iso_file, record_struct=record_struct)
-    for mfn, con in enumerate(containers, 1):
-        if only_active and con.status != b"0":
+                record_struct=None,
+                field_terminator=DEFAULT_FIELD_TERMINATOR,
+                record_terminator=DEFAULT_RECORD_TERMINATOR,
+                line_len=DEFAULT_LINE_LEN,
+                newline=DEFAULT_NEWLINE,
+                slab_size=DEFAULT_SLAB_SIZE):
+    """Generator of records as tidy lists of raw ``(tag, field)`` pairs.
+
+    The records are parsed like in ``iter_con``
+    (with the same keyword arguments),
+    which includes the file position restoring behavior:
+    a non-seekable file might have been read
+    up to a whole slab further than the last record given.
+    Without a ``record_struct``, only the leader of a skipped record
+    (e.g. an inactive one when ``only_active`` is True) gets parsed,
+    so a corrupt directory or field data there won't raise an error,
+    unlike in ``iter_con``.
+    """
+    if record_struct is None:
+        status_pairs = _fast_iter_status_pairs(
+            iso_file,
+            ftf=ftf,
+            field_terminator=field_terminator,
+            record_terminator=record_terminator,
+            line_len=line_len,
+            newline=newline,
+            slab_size=slab_size,
+        )
+    else:
+        status_pairs = (
+            (con.status, ((tag, bytes(field))
+                          for tag, field in con_pairs(con, ftf=ftf)))
+            for con in iter_con(iso_file, record_struct=record_struct)
+        )
+    for mfn, (status, pairs) in enumerate(status_pairs, 1):
+        if only_active and status != b"0":
             continue
         result = []
         if prepend_mfn:
             result.append((b"mfn", b"%d" % mfn))
         if prepend_status:
-            result.append((b"status", b"%d" % con.status))
-        result.extend(con_pairs(con, ftf=ftf))
+            result.append((b"status", b"%d" % status))
+        result.extend(pairs)
         yield result
 
 
@@ -182,18 +540,48 @@ def iter_tl(iso_file, encoding=DEFAULT_ISO_ENCODING, **kwargs):
                for tag, field in tl]
 
 
+@lru_cache(maxsize=None)
+def _has_ascii_separator(encoding):
+    """Check if the given encoding represents the ``DECODE_SEPARATOR``
+    as itself, in a single byte.
+    """
+    try:
+        return DECODE_SEPARATOR.encode(encoding) == DECODE_SEPARATOR_BYTES
+    except UnicodeError:
+        return False
+
+
+def _decode_values(values, encoding):
+    """Decode a list of bytes-like objects with a single decode call,
+    joining them with the ``DECODE_SEPARATOR`` if it's possible.
+    """
+    if len(values) > 1 and _has_ascii_separator(encoding):
+        joined = DECODE_SEPARATOR_BYTES.join(values)
+        result = joined.decode(encoding).split(DECODE_SEPARATOR)
+        if len(result) == len(values):  # No separator in the data
+            return result
+    return [str(value, encoding) for value in values]
+
+
 def con2dict(con, encoding=DEFAULT_ISO_ENCODING, ftf=DEFAULT_ISO_FTF):
     """Parsed construct object to dictionary record converter."""
-    result = defaultdict(list)
+    groups = {}
     for tag_value, field_value in con_pairs(con, ftf=ftf):
-        result[tag_value.decode("ascii")].append(field_value.decode(encoding))
-    return result
+        groups.setdefault(tag_value, []).append(field_value)
+    return {tag_value.decode("ascii"): _decode_values(values, encoding)
+            for tag_value, values in groups.items()}
+
+
+@lru_cache(maxsize=1024)
+def _tag_bytes(key):
+    """Raw ISO tag of a record dict key, like ``"1"`` to ``b"001"``."""
+    return key.encode("ascii").zfill(TAG_LEN)
 
 
 def dict2bytes(
     data,
     encoding=DEFAULT_ISO_ENCODING,
-    record_struct=DEFAULT_RECORD_STRUCT,
+    record_struct=DEFAULT_BUILD_RECORD_STRUCT,
 ):
     """Encode/build the raw ISO string from a single dict record."""
     record_dict = {
@@ -201,7 +589,55 @@ def dict2bytes(
         "fields": [],
     }
     for k, values in data.items():
+        tag = _tag_bytes(k)
         for v in values:
-            record_dict["dir"].append({"tag": k.encode("ascii").zfill(3)})
+            record_dict["dir"].append({"tag": tag})
             record_dict["fields"].append(v.encode(encoding))
     return record_struct.build(record_dict)
+
+
+def dict2bytes_fast(
+    data,
+    encoding=DEFAULT_ISO_ENCODING,
+    field_terminator=DEFAULT_FIELD_TERMINATOR,
+    record_terminator=DEFAULT_RECORD_TERMINATOR,
+    line_len=DEFAULT_LINE_LEN,
+    newline=DEFAULT_NEWLINE,
+):
+    """Encode/build the raw ISO string from a single dict record
+    without construct, always using the default directory entry map.
+    The keyword arguments have the same meaning
+    they have in ``create_record_struct``.
+    """
+    tags = []
+    fields = []
+    for k, values in data.items():
+        tag = _tag_bytes(k)
+        for v in values:
+            tags.append(tag)
+            fields.append(v.encode(encoding))
+    ft_len = len(field_terminator)
+    lens = [len(field) + ft_len for field in fields]
+    poss = list(accumulate(chain([0], lens)))
+    directory = _build_directory(tags, lens, poss, [b""] * len(tags),
+                                 *DEFAULT_ENTRY_MAP)
+    base_addr = LEADER_LEN + len(directory) + ft_len
+    total_len = base_addr + poss[-1] + len(record_terminator)
+    if total_len >= 10 ** TOTAL_LEN_LEN:
+        raise StreamError(f"Record total_len value {total_len} "
+                          f"doesn't fit in {TOTAL_LEN_LEN} byte(s)")
+
+    result = b"".join([
+        b"%05d0000000%05d000%d%d%d0" % (total_len, base_addr,
+                                        *DEFAULT_ENTRY_MAP),
+        directory,
+        field_terminator,
+        *[field + field_terminator for field in fields],
+        record_terminator,
+    ])
+    if not line_len:
+        return result
+    return newline.join([
+        result[start:start + line_len]
+        for start in range(0, total_len, line_len)
+    ] + [b""])
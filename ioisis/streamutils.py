@@ -1,12 +1,35 @@
-from functools import update_wrapper
+from contextlib import contextmanager
+from functools import lru_cache, update_wrapper
 from inspect import isgeneratorfunction, signature
 import io
+import mmap
+import re
 
 
-def should_be_file(file_argname, mode="rb"):
+@contextmanager
+def _open_file(file_name, mode, use_mmap):
+    """Open the file, giving a read-only memory map of it
+    when required and possible (e.g. it's not empty nor a pipe).
+    The memory map isn't explicitly closed,
+    as memoryview objects of it might still be in use,
+    it gets released/unmapped when no longer referenced.
+    """
+    with open(file_name, mode) as file_obj:
+        mapped = None
+        if use_mmap:
+            try:
+                mapped = mmap.mmap(file_obj.fileno(), 0,
+                                   access=mmap.ACCESS_READ)
+            except (ValueError, OSError):
+                pass
+        yield file_obj if mapped is None else mapped
+
+
+def should_be_file(file_argname, mode="rb", use_mmap=False):
     """Decorator to enforce the given argument is a file-like object.
     If it isn't, it will be seen as a filename,
-    and it'll be replaced by the open file with the given mode.
+    and it'll be replaced by the open file with the given mode,
+    or by a read-only ``mmap.mmap`` of it if ``use_mmap`` is True.
     """
     def decorator(func):
         if isgeneratorfunction(func):
@@ -16,7 +39,7 @@ def should_be_file(file_argname, mode="rb"):
                 if hasattr(file_arg, "read"):  # Already a file, nothing to do
                     yield from func(*args, **kwargs)
                     return
-                with open(file_arg, mode) as file_obj:  # "Cast" name to file
+                with _open_file(file_arg, mode, use_mmap) as file_obj:
                     bound_args.arguments[file_argname] = file_obj
                     yield from func(*bound_args.args, **bound_args.kwargs)
         else:
@@ -29,12 +52,55 @@ class LineSplitError(Exception):
     pass
 
 
+@lru_cache(maxsize=None)
+def _create_newline_regex(newline):
+    return re.compile(re.escape(newline))
+
+
+def join_lines(raw, line_len, newline, first_line_len=None, validate=False):
+    """Remove the line splitting from the raw bytes-like data.
+
+    Parameters
+    ----------
+    raw : bytes-like
+        Line splitted data, where every line but the first
+        should have ``line_len`` bytes followed by the ``newline``.
+        It might have a trailing incomplete line.
+    line_len : int
+        Number of bytes in each line, apart from the newline.
+    newline : bytes
+        End of line character/string.
+    first_line_len : int or None
+        Number of bytes in the first line (default is ``line_len``).
+    validate : bool
+        Always check the position of each newline.
+        If ``False``, the newlines are removed with a single regex call,
+        and the positions are checked only if the number of newlines
+        found isn't the expected one
+        (e.g. because there's a newline inside the data).
+    """
+    if first_line_len is None:
+        first_line_len = line_len
+    nl_len = len(newline)
+    eols = range(first_line_len, len(raw), line_len + nl_len)
+    if not validate:
+        data, nl_count = _create_newline_regex(newline).subn(b"", raw)
+        if nl_count == len(eols):
+            return data
+    if any(raw[eol:eol + nl_len] != newline for eol in eols):
+        raise LineSplitError("Invalid record line splitting")
+    return b"".join([raw[:first_line_len]] + [
+        raw[eol + nl_len:eol + nl_len + line_len] for eol in eols
+    ])
+
+
 class LineSplittedBytesStreamWrapper:
 
-    def __init__(self, substream, line_len, newline):
+    def __init__(self, substream, line_len, newline, validate=False):
         self.substream = substream
         self.line_len = line_len
         self.newline = newline
+        self.validate = validate
         self.rnext_eol = line_len
         self.writing = False
 
@@ -42,37 +108,60 @@ class LineSplittedBytesStreamWrapper:
         if self.substream.read(len(self.newline)) != self.newline:
             raise LineSplitError("Invalid record line splitting")
 
+    def _raw_len(self, count):
+        """Number of bytes in the substream to read ``count`` bytes."""
+        if count < self.rnext_eol:
+            return count
+        eol_count = 1 + (count - self.rnext_eol) // self.line_len
+        return count + eol_count * len(self.newline)
+
+    def _check_trailing_eol(self, raw):
+        """Check if the raw data, which should start at the current
+        position of the substream, doesn't end exactly where a newline
+        should be, as it would happen at the end of the substream
+        when the last line has no newline.
+        """
+        after_eol = len(raw) - self.rnext_eol
+        if after_eol >= 0 \
+                and after_eol % (self.line_len + len(self.newline)) == 0:
+            raise LineSplitError("Invalid record line splitting")
+
+    def _join_lines(self, raw):
+        """Remove the newlines from the raw data, which should start
+        at the current position of the substream.
+        """
+        return join_lines(raw, line_len=self.line_len, newline=self.newline,
+                          first_line_len=self.rnext_eol,
+                          validate=self.validate)
+
     def read(self, count=None):
-        result = []
-        remaining = float("inf") if count is None else count
-        while remaining > 0:
-            expected_len = min(self.rnext_eol, remaining)
-            data = self.substream.read(expected_len)
-            data_len = len(data)
-            result.append(data)
-            remaining -= data_len
-            if self.rnext_eol == data_len:
-                self._check_eol()
-                self.rnext_eol = self.line_len
-            else:
-                self.rnext_eol -= data_len
-                break
-        return b"".join(result)
+        if count is None:
+            raw = self.substream.read()
+        else:
+            raw = self.substream.read(self._raw_len(count))
+        self._check_trailing_eol(raw)
+        result = self._join_lines(raw)
+        result_len = len(result)
+        if result_len < self.rnext_eol:
+            self.rnext_eol -= result_len
+        else:
+            self.rnext_eol = self.line_len - \
+                             (result_len - self.rnext_eol) % self.line_len
+        return result
 
     def write(self, data):
         self.writing = True
-        result = remaining = len(data)
-        while data:
-            buff_len = min(self.rnext_eol, remaining)
-            buff, data = (data[:buff_len], data[buff_len:])
-            self.substream.write(buff)
-            remaining -= buff_len
-            if self.rnext_eol == buff_len:
-                self.substream.write(self.newline)
-                self.rnext_eol = self.line_len
-            else:
-                self.rnext_eol -= buff_len
-                break
+        result = len(data)
+        view = memoryview(data)
+        buffer = bytearray()
+        start, end = 0, self.rnext_eol
+        while end <= result:
+            buffer += view[start:end]
+            buffer += self.newline
+            start, end = end, end + self.line_len
+        buffer += view[start:]
+        self.substream.write(buffer)
+        self.rnext_eol = end - result
         return result
 
     def close(self):
@@ -155,3 +244,76 @@ class TightBufferReadOnlyBytesStreamWrapper:
         else:
             raise ValueError("Invalid whence")
         return self.offset
+
+
+class SlabBufferReadOnlyBytesStreamWrapper:
+    """Read-only stream wrapper that reads the substream in large slabs,
+    giving memoryview windows of them to avoid copying the data.
+    """
+    def __init__(self, substream, slab_size):
+        self.substream = substream
+        self.slab_size = slab_size
+        self.slab = memoryview(b"")
+        self.offset = 0
+        # Prefer to return what's available (e.g. from a pipe)
+        # instead of blocking until a whole slab gets filled
+        self._read = getattr(substream, "read1", substream.read)
+
+    def peek(self, size):
+        """Get the next ``size`` bytes as a memoryview without consuming
+        them, which might have less bytes at the end of the stream.
+        """
+        missing = self.offset + size - len(self.slab)
+        if missing > 0:
+            chunks = [self.slab[self.offset:]]
+            while missing > 0:
+                chunk = self._read(max(self.slab_size, missing))
+                if not chunk:
+                    break
+                chunks.append(chunk)
+                missing -= len(chunk)
+            self.slab = memoryview(b"".join(chunks))
+            self.offset = 0
+        return self.slab[self.offset:self.offset + size]
+
+    def read(self, size):
+        result = self.peek(size)
+        self.offset += len(result)
+        return result
+
+    def close(self):
+        """Give the read but unused slab data back to the substream
+        by seeking it backwards, when it's seekable.
+        """
+        unused = len(self.slab) - self.offset
+        if unused and getattr(self.substream, "seekable", lambda: False)():
+            self.substream.seek(-unused, io.SEEK_CUR)
+        self.slab = memoryview(b"")
+        self.offset = 0
+
+
+class MemoryViewReadOnlyBytesStreamWrapper:
+    """Read-only stream wrapper for data already in memory
+    (e.g. a ``mmap.mmap``), with the same ``peek``/``read`` interface
+    of ``SlabBufferReadOnlyBytesStreamWrapper``,
+    giving memoryview windows of the data without copying it.
+    """
+    def __init__(self, data, offset=0):
+        self.data = data
+        self.view = memoryview(data)
+        self.offset = offset
+
+    def peek(self, size):
+        return self.view[self.offset:self.offset + size]
+
+    def read(self, size):
+        result = self.peek(size)
+        self.offset += len(result)
+        return result
+
+    def close(self):
+        """Move the data position (e.g. of the ``mmap.mmap``)
+        to where the reading stopped, if it has one.
+        """
+        if hasattr(self.data, "seek"):
+            self.data.seek(self.offset)
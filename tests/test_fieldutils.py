@@ -1,4 +1,5 @@
 from inspect import signature
+import re
 import types
 
 import pytest
@@ -55,6 +56,33 @@ def test_ftf(template, expected, kwargs):
     assert ftf(**kwargs) == expected
 
 
+@pytest.mark.parametrize("template, expected, kwargs", FTF_TEST_PARAMS)
+def test_ftf_repeated_calls(template, expected, kwargs):
+    ftf = FieldTagFormatter(template, int_tags=isinstance(kwargs["tag"], int))
+    assert ftf(**kwargs) == ftf(**kwargs) == expected
+    if re.search("%[0-9]*i", str(template)):  # Index templates aren't cached
+        assert ftf._cache == {}
+    else:
+        assert ftf._cache == {kwargs["tag"]: expected}
+
+
+def test_ftf_cache(monkeypatch):
+    ftf = FieldTagFormatter("%z", int_tags=False)
+    assert ftf("012", 3) == ftf("012", 7) == "12"
+    assert ftf._cache == {"012": "12"}
+
+    ftf_index = FieldTagFormatter("%z.%i", int_tags=False)
+    assert ftf_index("012", 3) == "12.3"
+    assert ftf_index("012", 7) == "12.7"
+    assert ftf_index._cache == {}
+
+    monkeypatch.setattr("ioisis.fieldutils.FTF_CACHE_SIZE", 2)
+    ftf_small = FieldTagFormatter("v%r", int_tags=False)
+    assert [ftf_small(tag) for tag in ["001", "002", "003", "003"]] == \
+        ["v001", "v002", "v003", "v003"]
+    assert ftf_small._cache == {"001": "v001", "002": "v002"}
+
+
 @pytest.mark.parametrize("template, expected, kwargs", FTF_TEST_PARAMS)
 def test_ftf_scanf(template, expected, kwargs):
     ftf = FieldTagFormatter(template, int_tags=isinstance(kwargs["tag"], int))
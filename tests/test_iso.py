@@ -1,8 +1,16 @@
 import io
+import mmap
 
-from ioisis.iso import con2dict, DEFAULT_RECORD_STRUCT, \
-                       iter_raw_tl, iter_records
-from ioisis.fieldutils import nest_decode, tl2record
+from construct import CheckError, ConstError, StreamError
+import pytest
+
+from ioisis.iso import con2dict, create_record_struct, \
+                       DEFAULT_RECORD_STRUCT, dict2bytes, dict2bytes_fast, \
+                       iter_con, iter_raw_tl, iter_records
+from ioisis.ccons import LineSplitRestreamed
+from ioisis.fieldutils import FieldTagFormatter, nest_decode, \
+                              tl2record
+from ioisis.streamutils import LineSplitError
 
 
 def test_tag_zero():
@@ -23,3 +31,194 @@ def test_converting_iter_raw_tl_result_to_behave_like_iter_records():
     tl, = iter_raw_tl(io.BytesIO(iso_data))
     record, = iter_records(io.BytesIO(iso_data), encoding="utf-8")
     assert record == nest_decode(tl2record(tl), encoding="utf-8")
+
+
+def test_iter_con_without_struct_parses_like_the_record_struct():
+    record_struct = create_record_struct(line_len=10, newline=b"\r\n")
+    iso_data = b"".join(record_struct.build(con) for con in [
+        {"dir": [{"tag": b"001"}, {"tag": b"abc"}],
+         "fields": [b"first", b"second field"]},
+        {"dir": [], "fields": []},
+        {"dir": [{"tag": b"999"}], "fields": [b"1234"]},
+    ])
+    expected = list(iter_con(io.BytesIO(iso_data), record_struct))
+    for slab_size in [1, 7, 2 ** 20]:
+        result = list(iter_con(io.BytesIO(iso_data), line_len=10,
+                               newline=b"\r\n", slab_size=slab_size))
+        assert len(result) == len(expected) == 3
+        for con, expected_con in zip(result, expected):
+            for key, value in con.items():
+                assert expected_con[key] == value
+
+
+def test_iter_raw_tl_without_struct_gives_the_record_struct_pairs():
+    record_struct = create_record_struct(line_len=10, newline=b"\r\n")
+    iso_data = b"".join(record_struct.build(con) for con in [
+        {"dir": [{"tag": b"001"}, {"tag": b"abc"}, {"tag": b"001"}],
+         "fields": [b"first", b"second field", b"third"]},
+        {"status": b"1", "dir": [{"tag": b"001"}], "fields": [b"gone"]},
+        {"dir": [], "fields": []},
+    ])
+    ftf = FieldTagFormatter(b"%z.%i", int_tags=False)
+    kwargs = {"prepend_mfn": True, "ftf": ftf}
+    expected = list(iter_raw_tl(io.BytesIO(iso_data), **kwargs,
+                                record_struct=record_struct))
+    result = list(iter_raw_tl(io.BytesIO(iso_data), **kwargs,
+                              line_len=10, newline=b"\r\n"))
+    assert result == expected == [
+        [(b"mfn", b"1"), (b"1.0", b"first"), (b"abc.1", b"second field"),
+         (b"1.2", b"third")],
+        [(b"mfn", b"3")],
+    ]
+
+
+def test_iter_con_without_struct_record_smaller_than_leader():
+    for record_struct in [create_record_struct(line_len=0), None]:
+        with pytest.raises(StreamError):
+            list(iter_con(io.BytesIO(b"00010abcde"), record_struct,
+                          line_len=0))
+
+
+@pytest.mark.parametrize("line_len", [0, 80])
+@pytest.mark.parametrize("junk", [b"\n", b"\x1a", b"abcde"])
+def test_iter_con_without_struct_trailing_junk(line_len, junk):
+    iso_data = create_record_struct(line_len=line_len).build({
+        "dir": [{"tag": b"001"}], "fields": [b"data"],
+    })
+    with pytest.raises(StreamError, match="Invalid record total_len"):
+        list(iter_con(io.BytesIO(iso_data + junk), line_len=line_len))
+
+
+@pytest.mark.parametrize("record_struct", [DEFAULT_RECORD_STRUCT, None])
+def test_iter_records_resumes_on_the_same_stream(record_struct):
+    records = [{"1": [str(idx)]} for idx in range(3)]
+    iso_data = b"".join(map(dict2bytes, records))
+    iso_file = io.BytesIO(iso_data)
+    assert next(iter_records(iso_file, record_struct=record_struct)) \
+        == records[0]
+    assert iso_file.tell() == len(iso_data) // 3
+    assert list(iter_records(iso_file, record_struct=record_struct)) \
+        == records[1:]
+    assert iso_file.tell() == len(iso_data)
+
+
+def test_line_splitting_with_newline_in_field_data():
+    record_struct = create_record_struct(line_len=4, newline=b"\n")
+    iso_data = record_struct.build({
+        "dir": [{"tag": b"001"}, {"tag": b"002"}],
+        "fields": [b"a\nb\n", b"\n\nc"],
+    })
+    record, = iter_records(io.BytesIO(iso_data), encoding="ascii",
+                           line_len=4, newline=b"\n")
+    assert record == {"1": ["a\nb\n"], "2": ["\n\nc"]}
+    con, = iter_con(io.BytesIO(iso_data), record_struct)
+    assert con.fields == [b"a\nb\n", b"\n\nc"]
+
+
+@pytest.mark.parametrize("validate", [False, True])
+def test_line_splitting_without_the_last_newline(validate):
+    record_struct = create_record_struct(line_len=10)
+    iso_data = record_struct.build({"dir": [{"tag": b"001"}],
+                                    "fields": [b"a"]})
+    assert len(iso_data) == 40 + 4  # A multiple of line_len plus newlines
+    ls_struct = LineSplitRestreamed(create_record_struct(line_len=0),
+                                    line_len=10, validate=validate)
+    assert ls_struct.parse(iso_data) == record_struct.parse(iso_data)
+    with pytest.raises(LineSplitError):
+        ls_struct.parse(iso_data[:-1])
+    with pytest.raises(StreamError):
+        list(iter_con(io.BytesIO(iso_data[:-1]), line_len=10))
+
+
+def test_con2dict_repeated_tags_with_separator_like_data():
+    iso_data = DEFAULT_RECORD_STRUCT.build({
+        "dir": [{"tag": b"001"}, {"tag": b"002"}, {"tag": b"001"}],
+        "fields": [b"a\x1fb", b"c", b"d"],
+    })
+    record, = iter_records(io.BytesIO(iso_data), encoding="ascii")
+    assert record == {"1": ["a\x1fb", "d"], "2": ["c"]}
+
+
+def test_non_strict_record_struct_skips_directory_position_check():
+    iso_data = b"000570000000000490004500001000300000010000400004#ab#cde##"
+    with pytest.raises(CheckError):
+        create_record_struct(line_len=0).parse(iso_data)
+    con = create_record_struct(line_len=0, strict=False).parse(iso_data)
+    assert con.fields == [b"ab", b"cde"]
+
+
+def test_specialized_record_struct_builds_like_the_generic_one():
+    record_dict = {
+        "dir": [{"tag": b"001"}, {"tag": b"010"}],
+        "fields": [b"first", b"second"],
+    }
+    specialized_struct = create_record_struct(entry_map=(4, 5, 0))
+    iso_data = DEFAULT_RECORD_STRUCT.build(record_dict)
+    assert specialized_struct.build(record_dict) == iso_data
+    assert specialized_struct.parse(iso_data) == \
+        DEFAULT_RECORD_STRUCT.parse(iso_data)
+    other_data = DEFAULT_RECORD_STRUCT.build({**record_dict, "len_len": 3})
+    with pytest.raises(ConstError):
+        specialized_struct.parse(other_data)
+
+
+@pytest.mark.parametrize("line_len", [0, 7, 80])
+def test_dict2bytes_fast_builds_like_dict2bytes(line_len):
+    record_struct = create_record_struct(line_len=line_len)
+    data = {"1": ["a" * 90, "b"], "23": ["\xe7"], "456": []}
+    assert dict2bytes_fast(data, line_len=line_len) == \
+        dict2bytes(data, record_struct=record_struct)
+    assert dict2bytes_fast({}, line_len=line_len) == \
+        dict2bytes({}, record_struct=record_struct)
+    with pytest.raises(StreamError):
+        dict2bytes_fast({"1234": ["x"]}, line_len=line_len)
+    with pytest.raises(StreamError, match="total_len value 126026"):
+        dict2bytes_fast({"1": ["x"] * 9000}, line_len=line_len)
+    with pytest.raises(StreamError):
+        dict2bytes({"1": ["x"] * 9000}, record_struct=record_struct)
+
+
+@pytest.mark.parametrize("line_len", [0, 10])
+def test_iter_con_with_file_name_keeps_memory_mapped_fields(tmp_path,
+                                                            line_len):
+    record_struct = create_record_struct(line_len=line_len)
+    records_data = [record_struct.build(con) for con in [
+        {"dir": [{"tag": b"001"}], "fields": [b"first record"]},
+        {"dir": [{"tag": b"002"}], "fields": [b"second"]},
+    ]]
+    iso_data = b"".join(records_data)
+    iso_path = tmp_path / "file.iso"
+    iso_path.write_bytes(iso_data)
+    cons = list(iter_con(str(iso_path), line_len=line_len))
+    assert cons == list(iter_con(io.BytesIO(iso_data), line_len=line_len))
+    assert [bytes(con.fields[0]) for con in cons] == [b"first record",
+                                                      b"second"]
+    if not line_len:  # Otherwise the joined lines are new bytes objects
+        assert all(isinstance(con.fields[0].obj, mmap.mmap) for con in cons)
+
+    with open(iso_path, "rb") as iso_file:  # Resuming on a given mmap
+        iso_mmap = mmap.mmap(iso_file.fileno(), 0, access=mmap.ACCESS_READ)
+    first_con = next(iter_con(iso_mmap, line_len=line_len))
+    assert bytes(first_con.fields[0]) == b"first record"
+    assert iso_mmap.tell() == len(records_data[0])
+    assert list(iter_con(iso_mmap, line_len=line_len)) == cons[1:]
+    assert iso_mmap.tell() == len(iso_data)
+
+    empty_path = tmp_path / "empty.iso"
+    empty_path.write_bytes(b"")
+    assert list(iter_con(str(empty_path))) == []
+
+
+def test_build_invalid_directory_entry_widths():
+    with pytest.raises(StreamError):  # Tag widths 2 + 4 == 3 + 3
+        create_record_struct(line_len=0).build({
+            "dir": [{"tag": b"01"}, {"tag": b"0002"}],
+            "fields": [b"a", b"b"],
+        })
+    with pytest.raises(StreamError):  # Custom widths 1 + 3 == 2 + 2
+        create_record_struct(line_len=0).build({
+            "custom_len": 2,
+            "dir": [{"tag": b"001", "custom": b"1"},
+                    {"tag": b"002", "custom": b"333"}],
+            "fields": [b"a", b"b"],
+        })